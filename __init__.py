@@ -47,37 +47,80 @@ in Kv language:
 
 from kivy.animation import Animation
 from kivy.clock import Clock
+from kivy.core.text import Label as CoreLabel
 from kivy.garden.circularlayout import CircularLayout
 # from kivy.garden.recycleview import RecycleView
-from kivy.graphics import Line, Color, Ellipse
+from kivy.graphics import Line, Color, Ellipse, Rectangle
 from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import NumericProperty, BoundedNumericProperty,\
-                            ObjectProperty, StringProperty, DictProperty,\
+                            ObjectProperty, StringProperty,\
                             ListProperty, OptionProperty, BooleanProperty,\
                             ReferenceListProperty, AliasProperty
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.label import Label
+from kivy.uix.widget import Widget
 
-from math import atan, pi, radians, sin, cos
+from math import atan2, pi, sin, cos
 import datetime
 
+TWO_PI = 2 * pi
+_DEG2RAD = pi / 180.
+
 def map_number(x, in_min, in_max, out_min, out_max):
     return (x - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
 
+def number_angles(items, shown_items, start_angle, cw):
+    """Returns the angle of number 0, the angle between two consecutive
+    numbers and the offset that centers the touch areas on the shown numbers.
+    """
+    sign = +1.
+    angle_offset = start_angle * _DEG2RAD
+    if cw:
+        angle_offset = TWO_PI - angle_offset
+        sign = -1.
+    quota = TWO_PI / items
+
+    if items == shown_items:
+        angle_offset += quota / 2
+        pick_offset = 0.
+    else:
+        pick_offset = pi / shown_items
+        angle_offset -= pick_offset
+
+    return angle_offset, sign * quota, pick_offset
+
+def angle_at_pos(lx, ly, start_rad, cw, pick_offset):
+    """Returns the angle in [0, 2pi) of the point lx, ly (relative to the
+    center), as counted from the start angle in the picker's direction.
+    """
+    angle = atan2(ly, lx) + start_rad
+    if cw:
+        angle = -angle
+    return (angle - pick_offset) % TWO_PI
+
 def rgb_to_hex(*color):
-    tor = "#"
-    for c in color:
-        tor += "{:>02}".format(hex(int(c*255))[2:])
-    return tor
+    return "#" + "%02x" * len(color) % tuple(int(c*255) for c in color)
 
-Builder.load_string("""
+_number_labels = {}
+
+def number_texture(text, font_size):
+    """Returns a white texture of text rendered at font_size. Textures are
+    shared, so every distinct text and size is rendered only once.
+    """
+    if not text or font_size < 1:
+        return None
+    key = (text, font_size)
+    label = _number_labels.get(key)
+    if label is None:
+        # Resizing renders a new set for every size, don't keep them all
+        if len(_number_labels) > 256:
+            _number_labels.clear()
+        label = CoreLabel(text=text, font_size=font_size)
+        label.refresh()
+        _number_labels[key] = label
+    return label.texture
 
-<Number>:
-    text_size: self.size
-    valign: "middle"
-    halign: "center"
-    font_size: self.height * self.size_factor
+Builder.load_string("""
 
 <CircularNumberPicker>:
     canvas.before:
@@ -106,16 +149,37 @@ Builder.load_string("""
             width: self.minimum_width
             #pos_hint: {"center_x": 0.5}
 
-            Label:
+            BoxLayout:
                 id: timelabel
-                text: root.time_text
-                markup: True
-                halign: "right"
-                valign: "middle"
-                # text_size: self.size
                 size_hint_x: None #.6
-                width: self.texture_size[0]
-                font_size: self.height * .75
+                width: self.minimum_width
+
+                Label:
+                    id: hours_label
+                    text: root.hours_text
+                    markup: True
+                    halign: "right"
+                    valign: "middle"
+                    size_hint_x: None
+                    width: self.texture_size[0]
+                    font_size: self.height * .75
+
+                Label:
+                    text: ":"
+                    valign: "middle"
+                    size_hint_x: None
+                    width: self.texture_size[0]
+                    font_size: self.height * .75
+
+                Label:
+                    id: minutes_label
+                    text: root.minutes_text
+                    markup: True
+                    halign: "left"
+                    valign: "middle"
+                    size_hint_x: None
+                    width: self.texture_size[0]
+                    font_size: self.height * .75
 
             Label:
                 id: ampmlabel
@@ -131,11 +195,22 @@ Builder.load_string("""
     FloatLayout:
         id: picker_container
         #size_hint_y: 2./3
-        _bound: {}
+        _bound: []
 """)
 
-class Number(Label):
-    """The class used to show the numbers in the selector.
+class Number(Widget):
+    """The class used to show the numbers in the selector. The number is
+    drawn with a texture shared by all the :class:`Number`s with the same
+    text and size (see :func:`number_texture`) and tinted with
+    :attr:`color`, so it's never rendered again on repaints or color
+    changes.
+    """
+
+    text = StringProperty("")
+    """The number to show.
+
+    :attr:`text` is a :class:`~kivy.properties.StringProperty` and
+    defaults to "".
     """
 
     size_factor = NumericProperty(.5)
@@ -145,6 +220,36 @@ class Number(Label):
     defaults to 0.5.
     """
 
+    color = ListProperty([1, 1, 1])
+    """Color of the number. RGB or RGBA.
+
+    :attr:`color` is a :class:`~kivy.properties.ListProperty` and
+    defaults to [1, 1, 1] (white).
+    """
+
+    def __init__(self, **kw):
+        self._trigger_update = Clock.create_trigger(self._update, -1)
+        super(Number, self).__init__(**kw)
+        with self.canvas:
+            self._color = Color()
+            self._rect = Rectangle()
+        self._on_color()
+        self.fbind("color", self._on_color)
+        for name in ("text", "size_factor", "pos", "size"):
+            self.fbind(name, self._trigger_update)
+        self._trigger_update()
+
+    def _on_color(self, *a):
+        c = self.color
+        self._color.rgba = c if len(c) == 4 else [c[0], c[1], c[2], 1]
+
+    def _update(self, *a):
+        texture = number_texture(self.text, int(self.height * self.size_factor))
+        w, h = texture.size if texture else (0, 0)
+        self._rect.texture = texture
+        self._rect.size = w, h
+        self._rect.pos = self.center_x - w / 2., self.center_y - h / 2.
+
 class CircularNumberPicker(CircularLayout):
     """A circular number picker based on CircularLayout. A selector will
     help you pick a number. You can also set :attr:`multiples_of` to make
@@ -242,62 +347,113 @@ class CircularNumberPicker(CircularLayout):
 
     def _get_items(self):
         return self.max - self.min
-    items = AliasProperty(_get_items, None)
+    items = AliasProperty(_get_items, None, bind=("min", "max"), cache=True)
 
     def _get_shown_items(self):
-        c = 0
-        for i in range(*self.range):
-            if i % self.multiples_of == 0:
-                c += 1
-        return c
-    shown_items = AliasProperty(_get_shown_items, None)
+        m = self.multiples_of or 1
+        # First multiple of m in the range, and last value of the range
+        lo = self.min + ((-self.min) % m)
+        hi = self.max - 1
+        return 0 if hi < lo else (hi - lo) // m + 1
+    shown_items = AliasProperty(_get_shown_items, None, bind=("min", "max", "multiples_of"), cache=True)
 
     def __init__(self, **kw):
+        self._trig_table = None
+        self._angle_base = 0.
+        self._angle_step = 0.
+        self._inv_quota = 0.
+        self._pick_offset = 0.
+        self._start_rad = 0.
+        self._middle_r = 0.
+        self._cx = 0.
+        self._cy = 0.
+        self._esize = 0.
+        self._dsize = 0.
+        self._csize = 0.
+        self._er = 0.
+        self._dr = 0.
+        self._last_selected = None
+        self._last_sel_pos = None
+        self._last_dot_alpha = None
+        self._number_pool = []
+        self._text_cache = None
+        self._rgba_buf = [0, 0, 0, 1]
         self._trigger_genitems = Clock.create_trigger(self._genitems, -1)
         self.bind(min=self._trigger_genitems,
                   max=self._trigger_genitems,
-                  multiples_of=self._trigger_genitems)
+                  multiples_of=self._trigger_genitems,
+                  number_format_string=self._trigger_genitems)
+        self.bind(min=self._invalidate_text_cache,
+                  max=self._invalidate_text_cache,
+                  number_format_string=self._invalidate_text_cache)
+        self.bind(min=self._invalidate_trig_table,
+                  max=self._invalidate_trig_table,
+                  multiples_of=self._invalidate_trig_table,
+                  start_angle=self._invalidate_trig_table,
+                  direction=self._invalidate_trig_table)
         super(CircularNumberPicker, self).__init__(**kw)
+        self._update_geometry()
         self.selected = self.min
         self.bind(selected=self.on_selected,
-                  pos=self.on_selected,
-                  size=self.on_selected)
+                  pos=self._on_geometry,
+                  size=self._on_geometry,
+                  padding=self._on_geometry,
+                  radius_hint=self._on_geometry,
+                  number_size_factor=self._on_geometry)
 
-        cx = self.center_x + self.padding[0] - self.padding[2]
-        cy = self.center_y + self.padding[3] - self.padding[1]
-        sx, sy = self.pos_for_number(self.selected)
-        epos = [i - (self.delta_radii * self.number_size_factor) for i in (sx, sy)]
-        esize = [self.delta_radii * self.number_size_factor * 2]*2
-        dsize = [i * .3 for i in esize]
-        dpos = [i + esize[0] / 2. - dsize[0] / 2. for i in epos]
-        csize = [i * .05 for i in esize]
-        cpos = [i - csize[0] / 2. for i in (cx, cy)]
-        dot_alpha = 0 if self.selected % self.multiples_of == 0 else 1
         color = list(self.selector_color)
 
         with self.canvas:
             self._selection_color = Color(*(color + [self.selector_alpha]))
-            self._selection_circle = Ellipse(pos=epos, size=esize)
-            self._selection_line = Line(points=[cx, cy, sx, sy])
-            self._selection_dot_color = Color(*(color + [dot_alpha]))
-            self._selection_dot = Ellipse(pos=dpos, size=dsize)
+            self._selection_circle = Ellipse()
+            self._selection_line = Line()
+            self._selection_dot_color = Color(*color)
+            self._selection_dot = Ellipse()
             self._center_color = Color(*self.color)
-            self._center_dot = Ellipse(pos=cpos, size=csize)
+            self._center_dot = Ellipse()
+        self._on_geometry()
 
-        self.bind(selector_color=lambda ign, c: setattr(self._selection_color, "rgba", c + [self.selector_alpha]))
-        self.bind(selector_color=lambda ign, c: setattr(self._selection_dot_color, "rgb", c))
-        self.bind(color=lambda ign, c: setattr(self._center_color, "rgb", c))
+        self.fbind("selector_color", self._on_selector_color_changed)
+        self.fbind("color", self._on_color_changed)
         Clock.schedule_once(self._genitems)
-        Clock.schedule_once(self.on_selected) # Just to make sure pos/size are set
+        Clock.schedule_once(self._on_geometry) # Just to make sure pos/size are set
+
+    def _on_selector_color_changed(self, ign, c):
+        buf = self._rgba_buf
+        buf[0], buf[1], buf[2] = c[0], c[1], c[2]
+        buf[3] = self.selector_alpha
+        self._selection_color.rgba = buf
+        # Color.rgb would reset the alpha that on_selected manages
+        self._selection_dot_color.rgba = c[0], c[1], c[2], self._selection_dot_color.a
+
+    def _on_color_changed(self, ign, c):
+        self._center_color.rgb = c
+
+    def _invalidate_text_cache(self, *a):
+        self._text_cache = None
 
     def _genitems(self, *a):
-        self.clear_widgets()
-        for i in range(*self.range):
-            if i % self.multiples_of != 0:
-                continue
-            n = Number(text=self.number_format_string.format(i), size_factor=self.number_size_factor, color=self.color)
+        """Shows a :class:`Number` for each shown value. Number widgets are
+        kept in a pool and reused, so changing the range only updates their
+        text and adds or removes the difference.
+        """
+        if self._text_cache is None:
+            self._text_cache = [self.number_format_string.format(i) for i in range(*self.range)]
+        values = [i for i in range(*self.range) if i % self.multiples_of == 0]
+        pool = self._number_pool
+        while len(pool) < len(values):
+            n = Number(size_factor=self.number_size_factor, color=self.color)
             self.bind(color=n.setter("color"))
-            self.add_widget(n)
+            pool.append(n)
+
+        for n, i in zip(pool, values):
+            n.text = self._text_cache[i - self.min]
+            if n.parent is None:
+                self.add_widget(n)
+        # Unused numbers would still take a slot in the layout
+        for n in pool[len(values):]:
+            if n.parent is not None:
+                self.remove_widget(n)
 
     def on_touch_down(self, touch):
         if not self.collide_point(*touch.pos):
@@ -316,62 +472,89 @@ class CircularNumberPicker(CircularLayout):
         touch.ungrab(self)
 
     def on_selected(self, *a):
-        cx = self.center_x + self.padding[0] - self.padding[2]
-        cy = self.center_y + self.padding[3] - self.padding[1]
+        if not self._selection_circle or self.selected == self._last_selected:
+            return
+        self._last_selected = self.selected
         sx, sy = self.pos_for_number(self.selected)
-        epos = [i - (self.delta_radii * self.number_size_factor) for i in (sx, sy)]
-        esize = [self.delta_radii * self.number_size_factor * 2]*2
-        dsize = [i * .3 for i in esize]
-        dpos = [i + esize[0] / 2. - dsize[0] / 2. for i in epos]
-        csize = [i * .05 for i in esize]
-        cpos = [i - csize[0] / 2. for i in (cx, cy)]
-        dot_alpha = 0 if self.selected % self.multiples_of == 0 else 1
+        if (sx, sy) != self._last_sel_pos:
+            self._last_sel_pos = sx, sy
+            self._selection_circle.pos = sx - self._er, sy - self._er
+            self._selection_line.points = [self._cx, self._cy, sx, sy]
+            self._selection_dot.pos = sx - self._dr, sy - self._dr
 
-        if self._selection_circle:
-            self._selection_circle.pos = epos
-            self._selection_circle.size = esize
-        if self._selection_line:
-            self._selection_line.points = [cx, cy, sx, sy]
-        if self._selection_dot:
-            self._selection_dot.pos = dpos
-            self._selection_dot.size = dsize
-        if self._selection_dot_color:
+        dot_alpha = 0 if self.selected % self.multiples_of == 0 else 1
+        if dot_alpha != self._last_dot_alpha:
+            self._last_dot_alpha = dot_alpha
             self._selection_dot_color.a = dot_alpha
-        if self._center_dot:
-            self._center_dot.pos = cpos
-            self._center_dot.size = csize
 
         # print self.selected
 
+    def _on_geometry(self, *a):
+        self._update_geometry()
+        self.on_selected()
+
+    def _update_geometry(self, *a):
+        """Recomputes everything that depends on the widget's geometry but
+        not on :attr:`selected`.
+        """
+        radius = min(self.width-self.padding[0]-self.padding[2], self.height-self.padding[1]-self.padding[3]) / 2.
+        self._middle_r = radius * sum(self.radius_hint) / 2.
+        self._cx = self.center_x + self.padding[0] - self.padding[2]
+        self._cy = self.center_y + self.padding[3] - self.padding[1]
+        self._esize = self.delta_radii * self.number_size_factor * 2
+        self._dsize = self._esize * .3
+        self._csize = self._esize * .05
+        self._er = self._esize * .5
+        self._dr = self._dsize * .5
+        # Sizes and center changed, the selection must be moved even if the
+        # selected number's center didn't
+        self._last_selected = None
+        self._last_sel_pos = None
+
+        if not self._selection_circle:
+            return
+        self._selection_circle.size = [self._esize]*2
+        self._selection_dot.size = [self._dsize]*2
+        self._center_dot.pos = self._cx - self._csize * .5, self._cy - self._csize * .5
+        self._center_dot.size = [self._csize]*2
+
+    def _invalidate_trig_table(self, *a):
+        self._trig_table = None
+        self._last_selected = None
+
+    def _build_trig_table(self):
+        """Precomputes the cosine and sine of the angle of every number in
+        the range, so that :meth:`pos_for_number` doesn't need to call any
+        trigonometric function.
+        """
+        self._trig_table = []
+        if self.items <= 0:
+            return
+        self._angle_base, self._angle_step, self._pick_offset = \
+            number_angles(self.items, self.shown_items, self.start_angle, self.direction == "cw")
+        self._inv_quota = self.items / TWO_PI
+        self._start_rad = self.start_angle * _DEG2RAD
+        for n in range(*self.range):
+            angle = self._angle_base + n * self._angle_step
+            self._trig_table.append((cos(angle), sin(angle)))
+
     def pos_for_number(self, n):
         """Returns the center x, y coordinates for a given number.
         """
 
-        if self.items == 0:
+        if self._trig_table is None:
+            self._build_trig_table()
+        if not self._trig_table:
             return 0, 0
-        radius = min(self.width-self.padding[0]-self.padding[2], self.height-self.padding[1]-self.padding[3]) / 2.
-        middle_r = radius * sum(self.radius_hint) / 2.
-        cx = self.center_x + self.padding[0] - self.padding[2]
-        cy = self.center_y + self.padding[3] - self.padding[1]
-        sign = +1.
-        angle_offset = radians(self.start_angle)
-        if self.direction == 'cw':
-            angle_offset = 2 * pi - angle_offset
-            sign = -1.
-        quota = 2*pi / self.items
-        mult_quota = 2*pi / self.shown_items
-        angle = angle_offset + n * sign * quota
-
-        if self.items == self.shown_items:
-            angle += quota / 2
+        i = n - self.min
+        if 0 <= i < len(self._trig_table) and i == int(i):
+            ca, sa = self._trig_table[int(i)]
         else:
-            angle -= mult_quota / 2
+            angle = self._angle_base + n * self._angle_step
+            ca, sa = cos(angle), sin(angle)
 
         # kived: looking it up, yes. x = cos(angle) * radius + centerx; y = sin(angle) * radius + centery
-        x = cos(angle) * middle_r + cx
-        y = sin(angle) * middle_r + cy
-
-        return x, y
+        return ca * self._middle_r + self._cx, sa * self._middle_r + self._cy
 
     def number_at_pos(self, x, y):
         """Returns the number at a given x, y position. The number is found
@@ -379,37 +562,14 @@ class CircularNumberPicker(CircularLayout):
 
         Not thoroughly tested, may yield wrong results.
         """
-        if self.items == 0:
+        if self._trig_table is None:
+            self._build_trig_table()
+        if not self._trig_table:
             return self.min
-        cx = self.center_x + self.padding[0] - self.padding[2]
-        cy = self.center_y + self.padding[3] - self.padding[1]
-        lx = x - cx
-        ly = y - cy
-        quota = 2*pi / self.items
-        mult_quota = 2*pi / self.shown_items
-        if lx == 0 and ly > 0:
-            angle = pi/2
-        elif lx == 0 and ly < 0:
-            angle = 3*pi/2
-        else:
-            angle = atan(ly/lx)
-            if lx < 0 and ly > 0:
-                angle += pi
-            if lx > 0 and ly < 0:
-                angle += 2*pi
-            if lx < 0 and ly < 0:
-                angle += pi
-        angle += radians(self.start_angle)
-        if self.direction == "cw":
-            angle = 2*pi - angle
-        if mult_quota != quota:
-            angle -= mult_quota / 2
-        if angle < 0:
-            angle += 2*pi
-        elif angle > 2*pi:
-            angle -= 2*pi
-
-        return min(int(angle / quota) + self.min, self.max-1)
+        angle = angle_at_pos(x - self._cx, y - self._cy, self._start_rad,
+                             self.direction == "cw", self._pick_offset)
+
+        return min(int(angle * self._inv_quota) + self.min, self.max-1)
 
 class CircularMinutePicker(CircularNumberPicker):
     """:class:`CircularNumberPicker` implementation for minutes.
@@ -423,10 +583,13 @@ class CircularMinutePicker(CircularNumberPicker):
         self.number_format_string = "{:02d}"
         self.direction = "cw"
         self.bind(shown_items=self._update_start_angle)
-        Clock.schedule_once(self._update_start_angle)
-        Clock.schedule_once(self.on_selected)
+        self._update_start_angle()
 
     def _update_start_angle(self, *a):
+        # Setting range sets min before max, so shown_items can briefly be
+        # 0 (e.g. range = (13, 25) on an hour picker)
+        if not self.shown_items:
+            return
         self.start_angle = -(360. / self.shown_items / 2) - 90
 
 class CircularHourPicker(CircularNumberPicker):
@@ -446,10 +609,13 @@ class CircularHourPicker(CircularNumberPicker):
         # self.bind(military=lambda v: setattr(self, "max", 25 if v else 13))
         # self.bind(military=lambda v: setattr(self, "inner_radius_hint", .8 if self.military else .6))
         # Clock.schedule_once(self._genitems)
-        Clock.schedule_once(self._update_start_angle)
-        Clock.schedule_once(self.on_selected)
+        self._update_start_angle()
 
     def _update_start_angle(self, *a):
+        # Setting range sets min before max, so shown_items can briefly be
+        # 0 (e.g. range = (13, 25) on an hour picker)
+        if not self.shown_items:
+            return
         self.start_angle = (360. / self.shown_items / 2) - 90
 
 class CircularTimePicker(BoxLayout):
@@ -481,13 +647,22 @@ class CircularTimePicker(BoxLayout):
     """
 
     # military = BooleanProperty(False)
-    time_format = StringProperty("[color={hours_color}][ref=hours]{hours}[/ref][/color]:[color={minutes_color}][ref=minutes]{minutes:02d}[/ref][/color]")
-    """String that will be formatted with the time and shown in the time label.
+    hours_format = StringProperty("[color={hours_color}][ref=hours]{hours}[/ref][/color]")
+    """String that will be formatted with the hours and shown in the hours label.
     Can be anything supported by :meth:`str.format`. Make sure you don't
-    remove the refs. See the default for the arguments passed to format.
+    remove the ref. See the default for the arguments passed to format.
+
+    :attr:`hours_format` is a :class:`~kivy.properties.StringProperty` and
+    defaults to "[color={hours_color}][ref=hours]{hours}[/ref][/color]".
+    """
+
+    minutes_format = StringProperty("[color={minutes_color}][ref=minutes]{minutes:02d}[/ref][/color]")
+    """String that will be formatted with the minutes and shown in the minutes label.
+    Can be anything supported by :meth:`str.format`. Make sure you don't
+    remove the ref. See the default for the arguments passed to format.
 
-    :attr:`time_format` is a :class:`~kivy.properties.StringProperty` and
-    defaults to "[color={hours_color}][ref=hours]{hours}[/ref][/color]:[color={minutes_color}][ref=minutes]{minutes:02d}[/ref][/color]".
+    :attr:`minutes_format` is a :class:`~kivy.properties.StringProperty` and
+    defaults to "[color={minutes_color}][ref=minutes]{minutes:02d}[/ref][/color]".
     """
 
     ampm_format = StringProperty("[color={am_color}][ref=am]AM[/ref][/color]\n[color={pm_color}][ref=pm]PM[/ref][/color]")
@@ -530,13 +705,13 @@ class CircularTimePicker(BoxLayout):
     _am = BooleanProperty(True)
     _h_picker = ObjectProperty(None)
     _m_picker = ObjectProperty(None)
-    _bound = DictProperty({})
+    _bound = ListProperty([])
 
     def _get_time(self):
         return datetime.time(*self.time_list)
     def _set_time(self, dt):
         self.time_list = [dt.hour, dt.minute]
-    time = AliasProperty(_get_time, _set_time, bind=("time_list",))
+    time = AliasProperty(_get_time, _set_time, bind=("time_list",), cache=True)
     """Selected time as a datetime.time object.
 
     :attr:`time` is an :class:`~kivy.properties.AliasProperty`.
@@ -548,22 +723,61 @@ class CircularTimePicker(BoxLayout):
         return self._m_picker
     _picker = AliasProperty(_get_picker, None)
 
-    def _get_time_text(self):
-        hc = rgb_to_hex(*self.selector_color) if self.picker == "hours" else rgb_to_hex(*self.color)
-        mc = rgb_to_hex(*self.selector_color) if self.picker == "minutes" else rgb_to_hex(*self.color)
+    def _get_hex_colors(self):
+        """Returns :attr:`selector_color` and :attr:`color` as hex strings,
+        converting them only when they changed since the last call.
+        """
+        key = (tuple(self.selector_color), tuple(self.color))
+        if self._hex_cache is None or self._hex_cache[0] != key:
+            self._hex_cache = (key, (rgb_to_hex(*key[0]), rgb_to_hex(*key[1])))
+        return self._hex_cache[1]
+
+    def _get_hours_text(self):
+        sc, c = self._get_hex_colors()
+        key = (self.hours, self.picker, self.hours_format, sc, c)
+        if key == self._hours_text_key:
+            return self._hours_text_val
+        hc = sc if self.picker == "hours" else c
         h = self.hours == 0 and 12 or self.hours <= 12 and self.hours or self.hours - 12
-        m = self.minutes
-        return self.time_format.format(hours_color=hc, minutes_color=mc, hours=h, minutes=m)
-    time_text = AliasProperty(_get_time_text, None, bind=("hours", "minutes", "time_format", "picker"))
+        self._hours_text_key = key
+        self._hours_text_val = self.hours_format.format(hours_color=hc, hours=h)
+        return self._hours_text_val
+    hours_text = AliasProperty(_get_hours_text, None, bind=("hours", "hours_format", "picker", "selector_color", "color"))
+
+    def _get_minutes_text(self):
+        sc, c = self._get_hex_colors()
+        key = (self.minutes, self.picker, self.minutes_format, sc, c)
+        if key == self._minutes_text_key:
+            return self._minutes_text_val
+        mc = sc if self.picker == "minutes" else c
+        self._minutes_text_key = key
+        self._minutes_text_val = self.minutes_format.format(minutes_color=mc, minutes=self.minutes)
+        return self._minutes_text_val
+    minutes_text = AliasProperty(_get_minutes_text, None, bind=("minutes", "minutes_format", "picker", "selector_color", "color"))
 
     def _get_ampm_text(self):
-        amc = rgb_to_hex(*self.selector_color) if self._am else rgb_to_hex(*self.color)
-        pmc = rgb_to_hex(*self.selector_color) if not self._am else rgb_to_hex(*self.color)
-        return self.ampm_format.format(am_color=amc, pm_color=pmc)
-    ampm_text = AliasProperty(_get_ampm_text, None, bind=("hours", "ampm_format", "_am"))
+        sc, c = self._get_hex_colors()
+        key = (self._am, self.ampm_format, sc, c)
+        if key == self._ampm_text_key:
+            return self._ampm_text_val
+        amc = sc if self._am else c
+        pmc = sc if not self._am else c
+        self._ampm_text_key = key
+        self._ampm_text_val = self.ampm_format.format(am_color=amc, pm_color=pmc)
+        return self._ampm_text_val
+    ampm_text = AliasProperty(_get_ampm_text, None, bind=("hours", "ampm_format", "_am", "selector_color", "color"))
 
     def __init__(self, **kw):
+        self._hex_cache = None
+        self._hours_text_key = None
+        self._hours_text_val = ""
+        self._minutes_text_key = None
+        self._minutes_text_val = ""
+        self._ampm_text_key = None
+        self._ampm_text_val = ""
         super(CircularTimePicker, self).__init__(**kw)
+        self._color_rgba = list(self.color) + [1]
+        self.fbind("color", self._on_color_changed)
         if self.hours >= 12:
             self._am = False
         self.bind(time_list=self.on_time_list, picker=self._switch_picker, _am=self.on_ampm)
@@ -575,8 +789,12 @@ class CircularTimePicker(BoxLayout):
         Clock.schedule_once(lambda *a: self._switch_picker(noanim=True))
         #print "TIMEee", self.time
 
+    def _on_color_changed(self, ign, c):
+        self._color_rgba = list(c) + [1]
+
     def _init_later(self, *args):
-        self.ids.timelabel.bind(on_ref_press=self.on_ref_press)
+        self.ids.hours_label.bind(on_ref_press=self.on_ref_press)
+        self.ids.minutes_label.bind(on_ref_press=self.on_ref_press)
         self.ids.ampmlabel.bind(on_ref_press=self.on_ref_press)
 
     def on_ref_press(self, ign, ref):
@@ -636,23 +854,21 @@ class CircularTimePicker(BoxLayout):
 
         if len(self._bound) > 0:
             prevpicker.unbind(selected=self.on_selected)
-            self.unbind(**self._bound)
+            for name, uid in self._bound:
+                self.unbind_uid(name, uid)
         picker.bind(selected=self.on_selected)
-        self._bound = {"selector_color": picker.setter("selector_color"),
-                       "color":          picker.setter("color"),
-                       "selector_alpha": picker.setter("selector_alpha")}
-        self.bind(**self._bound)
-        
-        if len(container._bound) > 0:
-            container.unbind(**container._bound)
-        container._bound = {"size": picker.setter("size"),
-                            "pos":  picker.setter("pos")}
-        container.bind(**container._bound)
+        self._bound = [(name, self.fbind(name, picker.setter(name)))
+                       for name in ("selector_color", "color", "selector_alpha")]
+
+        for name, uid in container._bound:
+            container.unbind_uid(name, uid)
+        container._bound = [(name, container.fbind(name, picker.setter(name)))
+                            for name in ("size", "pos")]
 
         picker.pos = container.pos
         picker.size = container.size
         picker.selector_color = self.selector_color
-        picker.color = self.color + [1]
+        picker.color = self._color_rgba
         picker.selector_alpha = self.selector_alpha
 
         if noanim:
@@ -664,16 +880,25 @@ class CircularTimePicker(BoxLayout):
             container.add_widget(picker)
         else:
             if prevpicker in container.children:
+                # Stop its show animation if we're switching away mid-way
+                Animation.cancel_all(prevpicker)
                 anim = Animation(scale=1.5, d=.5, t="in_back") & Animation(opacity=0, d=.5, t="in_cubic")
+                anim.bind(on_complete=self._remove_prev_picker)
                 anim.start(prevpicker)
-                Clock.schedule_once(lambda *a: container.remove_widget(prevpicker), .5)#.31)
+            # Stop a pending hide of this picker if we're switching back to it
+            Animation.cancel_all(picker)
             picker.scale = 1.5
             picker.opacity = 0
             if picker.parent:
                 picker.parent.remove_widget(picker)
             container.add_widget(picker)
-            anim = Animation(scale=1, d=.5, t="out_back") & Animation(opacity=1, d=.5, t="out_cubic")
-            Clock.schedule_once(lambda *a: anim.start(picker), .3)
+            anim = Animation(scale=1.5, d=.3) + \
+                   (Animation(scale=1, d=.5, t="out_back") & Animation(opacity=1, d=.5, t="out_cubic"))
+            anim.start(picker)
+
+    def _remove_prev_picker(self, anim, picker):
+        if picker.parent:
+            picker.parent.remove_widget(picker)
 
 # class CalendarMonthView(GridLayout):
 #     month = BoundedNumericProperty(datetime.date.today().month, min=1, max=12)